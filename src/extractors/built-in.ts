@@ -115,7 +115,8 @@ function registerStyle(
  */
 export const layoutExtractor: ExtractorFn = (node, result, context) => {
   const layout = buildSimplifiedLayout(node, context.parent);
-  if (Object.keys(layout).length > 1) {
+  // A bare `{ mode: "none" }` says nothing; any other mode is worth emitting.
+  if (layout.mode !== "none" || Object.keys(layout).length > 1) {
     result.layout = findOrCreateVar(context.globalVars, layout, "layout");
   }
 };
@@ -205,7 +206,7 @@ export const visualsExtractor: ExtractorFn = (node, result, context) => {
 
   // effects
   const effects = buildSimplifiedEffects(node);
-  if (Object.keys(effects).length) {
+  if (effects) {
     result.effects = registerStyle(node, context, effects, ["effect", "effects"], "effect");
   }
 
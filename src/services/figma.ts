@@ -9,6 +9,7 @@ import { downloadAndProcessImage, type ImageProcessingResult } from "~/utils/ima
 import { Logger, writeLogs } from "~/utils/logger.js";
 import { fetchJSON } from "~/utils/fetch-json.js";
 import { getErrorMeta } from "~/utils/error-meta.js";
+import { createLimiter } from "~/utils/common.js";
 import { buildForbiddenMessage, buildRateLimitMessage } from "./errors/index.js";
 
 export type FigmaAuthOptions = {
@@ -17,6 +18,11 @@ export type FigmaAuthOptions = {
   useOAuth: boolean;
 };
 
+// Each download also decodes and may crop the image in-process, so an
+// asset-heavy node could otherwise hold dozens of decoded bitmaps at once.
+// Enough parallelism to hide network latency without that memory spike.
+const IMAGE_DOWNLOAD_CONCURRENCY = 8;
+
 type SvgOptions = {
   outlineText: boolean;
   includeId: boolean;
@@ -186,6 +192,9 @@ export class FigmaService {
     const resolvedPath = localPath;
     const { pngScale = 2, svgOptions } = options;
     const downloadPromises: Promise<ImageProcessingResult[]>[] = [];
+    // Shared across fills, PNG renders, and SVG renders so the cap holds for the
+    // whole call, not per category.
+    const limit = createLimiter(IMAGE_DOWNLOAD_CONCURRENCY);
 
     // Separate items by type: image/gif fills vs rendered nodes
     const imageFills = items.filter(
@@ -214,13 +223,15 @@ export class FigmaService {
             const fillRef = gifRef ?? imageRef;
             const imageUrl = fillRef ? fillUrls[fillRef] : undefined;
             return imageUrl
-              ? downloadAndProcessImage(
-                  fileName,
-                  resolvedPath,
-                  imageUrl,
-                  needsCropping,
-                  cropTransform,
-                  requiresImageDimensions,
+              ? limit(() =>
+                  downloadAndProcessImage(
+                    fileName,
+                    resolvedPath,
+                    imageUrl,
+                    needsCropping,
+                    cropTransform,
+                    requiresImageDimensions,
+                  ),
                 )
               : null;
           },
@@ -249,13 +260,15 @@ export class FigmaService {
           .map(({ nodeId, fileName, needsCropping, cropTransform, requiresImageDimensions }) => {
             const imageUrl = pngUrls[nodeId];
             return imageUrl
-              ? downloadAndProcessImage(
-                  fileName,
-                  resolvedPath,
-                  imageUrl,
-                  needsCropping,
-                  cropTransform,
-                  requiresImageDimensions,
+              ? limit(() =>
+                  downloadAndProcessImage(
+                    fileName,
+                    resolvedPath,
+                    imageUrl,
+                    needsCropping,
+                    cropTransform,
+                    requiresImageDimensions,
+                  ),
                 )
               : null;
           })
@@ -278,13 +291,15 @@ export class FigmaService {
           .map(({ nodeId, fileName, needsCropping, cropTransform, requiresImageDimensions }) => {
             const imageUrl = svgUrls[nodeId];
             return imageUrl
-              ? downloadAndProcessImage(
-                  fileName,
-                  resolvedPath,
-                  imageUrl,
-                  needsCropping,
-                  cropTransform,
-                  requiresImageDimensions,
+              ? limit(() =>
+                  downloadAndProcessImage(
+                    fileName,
+                    resolvedPath,
+                    imageUrl,
+                    needsCropping,
+                    cropTransform,
+                    requiresImageDimensions,
+                  ),
                 )
               : null;
           })
@@ -1,4 +1,4 @@
-import yaml from "js-yaml";
+import { dumpYaml } from "~/utils/yaml-dump.js";
 
 describe("Benchmarks", () => {
   const data = {
@@ -8,7 +8,8 @@ describe("Benchmarks", () => {
   };
 
   it("YAML should be token efficient", () => {
-    const yamlResult = yaml.dump(data);
+    // Measure the dumper the server actually ships, not js-yaml's defaults.
+    const yamlResult = dumpYaml(data);
     const jsonResult = JSON.stringify(data);
 
     expect(yamlResult.length).toBeLessThan(jsonResult.length);
@@ -15,14 +15,14 @@ describe("buildSimplifiedEffects — blur", () => {
     const result = buildSimplifiedEffects(
       nodeWithEffects([{ type: "LAYER_BLUR", radius: 32, visible: true }]),
     );
-    expect(result.filter).toBe("blur(16px)");
+    expect(result?.filter).toBe("blur(16px)");
   });
 
   it("halves a background blur radius onto the CSS backdrop-filter property", () => {
     const result = buildSimplifiedEffects(
       nodeWithEffects([{ type: "BACKGROUND_BLUR", radius: 32, visible: true }]),
     );
-    expect(result.backdropFilter).toBe("blur(16px)");
+    expect(result?.backdropFilter).toBe("blur(16px)");
   });
 
   // A zero-radius blur is a no-op; emitting blur(0px) is dead output.
@@ -33,7 +33,6 @@ describe("buildSimplifiedEffects — blur", () => {
         { type: "BACKGROUND_BLUR", radius: 0, visible: true },
       ]),
     );
-    expect(result.filter).toBeUndefined();
-    expect(result.backdropFilter).toBeUndefined();
+    expect(result).toBeUndefined();
   });
 });
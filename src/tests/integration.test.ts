@@ -1,9 +1,6 @@
-import { createServer } from "../mcp/index.js";
 import { config } from "dotenv";
-import { InMemoryTransport } from "@modelcontextprotocol/sdk/inMemory.js";
-import { Client } from "@modelcontextprotocol/sdk/client/index.js";
-import { CallToolResultSchema } from "@modelcontextprotocol/sdk/types.js";
-import yaml from "js-yaml";
+import type { Client } from "@modelcontextprotocol/sdk/client/index.js";
+import type { CallToolResultSchema } from "@modelcontextprotocol/sdk/types.js";
 import type { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
 
 config();
@@ -13,10 +10,21 @@ const describeOrSkip = process.env.RUN_FIGMA_INTEGRATION === "1" ? describe : de
 describeOrSkip("Figma MCP Server Tests", () => {
   let server: McpServer;
   let client: Client;
+  let callToolResultSchema: typeof CallToolResultSchema;
   let figmaApiKey: string;
   let figmaFileKey: string;
 
   beforeAll(async () => {
+    // Loaded here rather than at the top so the default, skipped run doesn't pay
+    // for importing the whole server and SDK graph just to collect this file.
+    const [{ createServer }, { InMemoryTransport }, { Client }, types] = await Promise.all([
+      import("../mcp/index.js"),
+      import("@modelcontextprotocol/sdk/inMemory.js"),
+      import("@modelcontextprotocol/sdk/client/index.js"),
+      import("@modelcontextprotocol/sdk/types.js"),
+    ]);
+    callToolResultSchema = types.CallToolResultSchema;
+
     figmaApiKey = process.env.FIGMA_API_KEY || "";
     figmaFileKey = process.env.FIGMA_FILE_KEY || "";
 
@@ -26,7 +34,9 @@ describeOrSkip("Figma MCP Server Tests", () => {
         figmaOAuthToken: "",
         useOAuth: false,
       },
-      { transport: "stdio", outputFormat: "yaml" },
+      // JSON.parse is native, while js-yaml parses in JS; YAML serialization has
+      // its own coverage in serialization.test.ts.
+      { transport: "stdio", outputFormat: "json" },
     );
 
     client = new Client({
@@ -57,12 +67,12 @@ describeOrSkip("Figma MCP Server Tests", () => {
             arguments: args,
           },
         },
-        CallToolResultSchema,
+        callToolResultSchema,
       );
 
       const firstContent = result.content[0];
       const content = firstContent.type === "text" ? firstContent.text : "";
-      const parsed = yaml.load(content);
+      const parsed = JSON.parse(content);
 
       expect(parsed).toBeDefined();
     }, 60000);
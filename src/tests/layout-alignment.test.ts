@@ -733,6 +733,20 @@ describe("grid layout", () => {
       expect(result.alignSelf).toBe("center");
     });
 
+    test("container outside auto-layout drops its inert layoutAlign", () => {
+      const container = makeFrame({
+        layoutMode: "HORIZONTAL",
+        layoutAlign: "CENTER",
+        absoluteBoundingBox: { x: 0, y: 0, width: 200, height: 100 },
+      });
+      const parent = makeFrame({
+        layoutMode: "NONE",
+        absoluteBoundingBox: { x: 0, y: 0, width: 400, height: 400 },
+        children: [container],
+      });
+      expect(buildSimplifiedLayout(container, parent).alignSelf).toBeUndefined();
+    });
+
     test("flex container inside grid parent gets grid child props", () => {
       // A child that is itself a flex row, but sits inside a grid
       const flexChild = makeFrame({
@@ -790,4 +804,10 @@ describe("aspectRatio zero-height guard", () => {
 
     expect(result.dimensions?.aspectRatio).toBe(2);
   });
+
+  test("rounds aspectRatio to four decimals", () => {
+    const result = buildSimplifiedLayout(columnChild(30), parent);
+
+    expect(result.dimensions?.aspectRatio).toBe(3.3333);
+  });
 });
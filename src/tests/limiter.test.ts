@@ -0,0 +1,34 @@
+import { createLimiter } from "~/utils/common.js";
+
+describe("createLimiter", () => {
+  it("never runs more than the cap at once and preserves queue order", async () => {
+    const limit = createLimiter(2);
+    let running = 0;
+    let peak = 0;
+    const started: number[] = [];
+
+    const results = await Promise.all(
+      [0, 1, 2, 3, 4].map((i) =>
+        limit(async () => {
+          started.push(i);
+          running++;
+          peak = Math.max(peak, running);
+          await new Promise((resolve) => setTimeout(resolve, 5));
+          running--;
+          return i * 10;
+        }),
+      ),
+    );
+
+    expect(peak).toBe(2);
+    expect(started).toEqual([0, 1, 2, 3, 4]);
+    expect(results).toEqual([0, 10, 20, 30, 40]);
+  });
+
+  it("frees the slot when a task rejects", async () => {
+    const limit = createLimiter(1);
+
+    await expect(limit(() => Promise.reject(new Error("boom")))).rejects.toThrow("boom");
+    await expect(limit(() => Promise.resolve("ok"))).resolves.toBe("ok");
+  });
+});
@@ -394,7 +394,10 @@ describe("fill flattening", () => {
 
     const { nodes, globalVars } = await extractFromDesign([node], allExtractors);
 
-    expect(fillsValue(nodes, globalVars)).toHaveLength(2);
+    const value = fillsValue(nodes, globalVars) as unknown[];
+    expect(value).toHaveLength(2);
+    // color.a is the paint's alpha exactly once, not squared.
+    expect(value[0]).toBe("rgba(0, 0, 0, 0.2)");
   });
 });
 
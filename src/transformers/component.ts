@@ -92,20 +92,19 @@ export function simplifyComponents(
   aggregatedComponents: Record<string, Component>,
   propertyDefinitions?: Record<string, Record<string, SimplifiedPropertyDefinition>>,
 ): Record<string, SimplifiedComponentDefinition> {
-  return Object.fromEntries(
-    Object.entries(aggregatedComponents).map(([id, comp]) => [
+  const result: Record<string, SimplifiedComponentDefinition> = {};
+  for (const [id, comp] of Object.entries(aggregatedComponents)) {
+    const simplified: SimplifiedComponentDefinition = {
       id,
-      {
-        id,
-        key: comp.key,
-        name: comp.name,
-        componentSetId: comp.componentSetId,
-        ...(propertyDefinitions?.[id] && {
-          propertyDefinitions: propertyDefinitions[id],
-        }),
-      },
-    ]),
-  );
+      key: comp.key,
+      name: comp.name,
+      componentSetId: comp.componentSetId,
+    };
+    const definitions = propertyDefinitions?.[id];
+    if (definitions) simplified.propertyDefinitions = definitions;
+    result[id] = simplified;
+  }
+  return result;
 }
 
 /**
@@ -115,18 +114,17 @@ export function simplifyComponentSets(
   aggregatedComponentSets: Record<string, ComponentSet>,
   propertyDefinitions?: Record<string, Record<string, SimplifiedPropertyDefinition>>,
 ): Record<string, SimplifiedComponentSetDefinition> {
-  return Object.fromEntries(
-    Object.entries(aggregatedComponentSets).map(([id, set]) => [
+  const result: Record<string, SimplifiedComponentSetDefinition> = {};
+  for (const [id, set] of Object.entries(aggregatedComponentSets)) {
+    const simplified: SimplifiedComponentSetDefinition = {
       id,
-      {
-        id,
-        key: set.key,
-        name: set.name,
-        description: set.description,
-        ...(propertyDefinitions?.[id] && {
-          propertyDefinitions: propertyDefinitions[id],
-        }),
-      },
-    ]),
-  );
+      key: set.key,
+      name: set.name,
+      description: set.description,
+    };
+    const definitions = propertyDefinitions?.[id];
+    if (definitions) simplified.propertyDefinitions = definitions;
+    result[id] = simplified;
+  }
+  return result;
 }
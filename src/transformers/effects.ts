@@ -4,7 +4,7 @@ import type {
   BlurEffect,
   Node as FigmaDocumentNode,
 } from "@figma/rest-api-spec";
-import { formatRGBAColor } from "~/transformers/style.js";
+import { formatRGBA } from "~/transformers/style.js";
 import { hasValue } from "~/utils/identity.js";
 import { pixelRound } from "~/utils/common.js";
 
@@ -15,34 +15,51 @@ export type SimplifiedEffects = {
   textShadow?: string;
 };
 
-export function buildSimplifiedEffects(n: FigmaDocumentNode): SimplifiedEffects {
-  if (!hasValue("effects", n)) return {};
-  const effects = n.effects.filter((e) => e.visible);
+/**
+ * Build the CSS-facing effects for a node, or undefined when it has none worth
+ * emitting. Returning undefined (rather than `{}`) lets the extractor skip the
+ * style without enumerating keys on every node.
+ */
+export function buildSimplifiedEffects(n: FigmaDocumentNode): SimplifiedEffects | undefined {
+  // Most nodes carry `effects: []`; bail before allocating any buckets.
+  if (!hasValue("effects", n) || n.effects.length === 0) return undefined;
 
-  // Handle drop and inner shadows (both go into CSS box-shadow)
-  const dropShadows = effects
-    .filter((e): e is DropShadowEffect => e.type === "DROP_SHADOW")
-    .map(simplifyDropShadow);
+  // One pass over the node's effects, bucketing each into the CSS property it
+  // feeds.
+  const dropShadows: string[] = [];
+  const innerShadows: string[] = [];
+  // Blur effects are separated by CSS property: layer blurs use 'filter',
+  // background blurs use 'backdrop-filter'.
+  const filterBlurs: string[] = [];
+  const backdropBlurs: string[] = [];
 
-  const innerShadows = effects
-    .filter((e): e is InnerShadowEffect => e.type === "INNER_SHADOW")
-    .map(simplifyInnerShadow);
-
-  const boxShadow = [...dropShadows, ...innerShadows].join(", ");
+  for (const effect of n.effects) {
+    if (!effect.visible) continue;
+    // Other effect types (texture, noise, …) have no CSS equivalent and fall through.
+    switch (effect.type) {
+      case "DROP_SHADOW":
+        dropShadows.push(simplifyShadow(effect));
+        break;
+      case "INNER_SHADOW":
+        innerShadows.push(`inset ${simplifyShadow(effect)}`);
+        break;
+      // A zero-radius blur is a no-op, so drop it entirely rather than emit a
+      // dead `blur(0px)`.
+      case "LAYER_BLUR":
+        if (effect.radius > 0) filterBlurs.push(simplifyBlur(effect));
+        break;
+      case "BACKGROUND_BLUR":
+        if (effect.radius > 0) backdropBlurs.push(simplifyBlur(effect));
+        break;
+    }
+  }
 
-  // Handle blur effects - separate by CSS property. A zero-radius blur is a
-  // no-op, so drop it entirely rather than emit a dead `blur(0px)`.
-  // Layer blurs use the CSS 'filter' property
-  const filterBlurValues = effects
-    .filter((e): e is BlurEffect => e.type === "LAYER_BLUR" && e.radius > 0)
-    .map(simplifyBlur)
-    .join(" ");
+  // Drop and inner shadows both go into CSS box-shadow, drop shadows first
+  const boxShadow = dropShadows.concat(innerShadows).join(", ");
+  const filterBlurValues = filterBlurs.join(" ");
+  const backdropFilterValues = backdropBlurs.join(" ");
 
-  // Background blurs use the CSS 'backdrop-filter' property
-  const backdropFilterValues = effects
-    .filter((e): e is BlurEffect => e.type === "BACKGROUND_BLUR" && e.radius > 0)
-    .map(simplifyBlur)
-    .join(" ");
+  if (!boxShadow && !filterBlurValues && !backdropFilterValues) return undefined;
 
   const result: SimplifiedEffects = {};
 
@@ -59,12 +76,11 @@ export function buildSimplifiedEffects(n: FigmaDocumentNode): SimplifiedEffects
   return result;
 }
 
-function simplifyDropShadow(effect: DropShadowEffect) {
-  return `${effect.offset.x}px ${effect.offset.y}px ${effect.radius}px ${effect.spread ?? 0}px ${formatRGBAColor(effect.color)}`;
-}
-
-function simplifyInnerShadow(effect: InnerShadowEffect) {
-  return `inset ${effect.offset.x}px ${effect.offset.y}px ${effect.radius}px ${effect.spread ?? 0}px ${formatRGBAColor(effect.color)}`;
+// Drop and inner shadows share a shape; only the `inset` keyword differs, which
+// the caller prepends. One formatter keeps this call site monomorphic.
+function simplifyShadow(effect: DropShadowEffect | InnerShadowEffect) {
+  const { offset, radius, spread = 0, color } = effect;
+  return `${offset.x}px ${offset.y}px ${radius}px ${spread}px ${formatRGBA(color.r, color.g, color.b, color.a)}`;
 }
 
 function simplifyBlur(effect: BlurEffect) {
@@ -1,5 +1,9 @@
-import { isInAutoLayoutFlow, isFrame, isLayout, isRectangle } from "~/utils/identity.js";
-import type { Node as FigmaDocumentNode, HasLayoutTrait } from "@figma/rest-api-spec";
+import { hasGridLayout, isInAutoLayoutFlow, isFrame, isLayout } from "~/utils/identity.js";
+import type {
+  Node as FigmaDocumentNode,
+  HasFramePropertiesTrait,
+  HasLayoutTrait,
+} from "@figma/rest-api-spec";
 import { generateCSSShorthand, pixelRound } from "~/utils/common.js";
 import {
   convertSelfAlign,
@@ -11,7 +15,8 @@ import {
   shouldEmitFixedDimension,
 } from "./layout/common.js";
 import { buildFlexGap, convertAlignItems, convertJustifyContent } from "./layout/flex.js";
-import { buildGridChildPositioning, isPackedGrid } from "./layout/grid.js";
+import { buildGridChildPositioning, getGridParentInfo } from "./layout/grid.js";
+import type { GridParentInfo } from "./layout/grid.js";
 import type { SimplifiedLayout } from "./layout/common.js";
 
 export type { SimplifiedLayout } from "./layout/common.js";
@@ -22,18 +27,41 @@ export function buildSimplifiedLayout(
   n: FigmaDocumentNode,
   parent?: FigmaDocumentNode,
 ): SimplifiedLayout {
-  const frameValues = buildSimplifiedFrameValues(n);
-  const parentGridPacked =
-    isFrame(parent) && parent.layoutMode === "GRID" && "children" in parent
-      ? isPackedGrid(parent.children as FigmaDocumentNode[])
-      : undefined;
-  const layoutValues =
-    buildSimplifiedLayoutValues(n, parent, frameValues.mode, parentGridPacked) || {};
-
-  return { ...frameValues, ...layoutValues };
+  // Neither builder has anything to add here, and skipping them also skips the
+  // parent-grid scan below.
+  if (!isFrame(n) && !isLayout(n)) return { mode: "none" };
+
+  const inAutoLayoutFlow = isInAutoLayoutFlow(n, parent);
+  const frameValues = buildSimplifiedFrameValues(n, inAutoLayoutFlow);
+  const parentGrid =
+    hasGridLayout(parent) && "children" in parent ? getGridParentInfo(parent) : undefined;
+  const layoutValues = buildSimplifiedLayoutValues(
+    n,
+    parent,
+    frameValues.mode,
+    inAutoLayoutFlow,
+    parentGrid,
+  );
+
+  // frameValues is freshly built for this call, so fold into it rather than
+  // copying both halves into a third object.
+  return layoutValues ? Object.assign(frameValues, layoutValues) : frameValues;
 }
 
-function buildSimplifiedFrameValues(n: FigmaDocumentNode): SimplifiedLayout | { mode: "none" } {
+// Built once rather than per frame. The arrays are shared by every layout that
+// scrolls the same way, so downstream code must treat them as read-only.
+const OVERFLOW_SCROLL: Partial<
+  Record<NonNullable<HasFramePropertiesTrait["overflowDirection"]>, ("x" | "y")[]>
+> = {
+  HORIZONTAL_SCROLLING: ["x"],
+  VERTICAL_SCROLLING: ["y"],
+  HORIZONTAL_AND_VERTICAL_SCROLLING: ["x", "y"],
+};
+
+function buildSimplifiedFrameValues(
+  n: FigmaDocumentNode,
+  inAutoLayoutFlow: boolean,
+): SimplifiedLayout | { mode: "none" } {
   if (!isFrame(n)) {
     return { mode: "none" };
   }
@@ -42,25 +70,32 @@ function buildSimplifiedFrameValues(n: FigmaDocumentNode): SimplifiedLayout | {
     mode: layoutModeToSchema(n.layoutMode),
   };
 
-  const overflowScroll: SimplifiedLayout["overflowScroll"] = [];
-  if (n.overflowDirection?.includes("HORIZONTAL")) overflowScroll.push("x");
-  if (n.overflowDirection?.includes("VERTICAL")) overflowScroll.push("y");
-  if (overflowScroll.length > 0) frameValues.overflowScroll = overflowScroll;
+  const overflowScroll = n.overflowDirection && OVERFLOW_SCROLL[n.overflowDirection];
+  if (overflowScroll) frameValues.overflowScroll = overflowScroll;
 
   const { mode } = frameValues;
   if (mode === "none") {
     return frameValues;
   }
 
-  // Shared across grid and flex containers
-  frameValues.alignSelf = convertSelfAlign(n.layoutAlign);
-  if (n.paddingTop || n.paddingBottom || n.paddingLeft || n.paddingRight) {
-    frameValues.padding = generateCSSShorthand({
-      top: n.paddingTop ?? 0,
-      right: n.paddingRight ?? 0,
-      bottom: n.paddingBottom ?? 0,
-      left: n.paddingLeft ?? 0,
-    });
+  // Shared across grid and flex containers. layoutAlign only means something to
+  // an auto-layout parent placing this frame; for a root, absolute, or
+  // hand-positioned child it's inert.
+  if (inAutoLayoutFlow) {
+    // Only defined values are written, so the layout carries no `undefined`
+    // placeholders for the merge, the extractor's emptiness check, or
+    // stableStringify to walk past.
+    const alignSelf = convertSelfAlign(n.layoutAlign);
+    if (alignSelf) frameValues.alignSelf = alignSelf;
+  }
+  const {
+    paddingTop: top = 0,
+    paddingRight: right = 0,
+    paddingBottom: bottom = 0,
+    paddingLeft: left = 0,
+  } = n;
+  if (top || right || bottom || left) {
+    frameValues.padding = generateCSSShorthand({ top, right, bottom, left });
   }
 
   if (mode === "grid") {
@@ -73,15 +108,19 @@ function buildSimplifiedFrameValues(n: FigmaDocumentNode): SimplifiedLayout | {
     const rows = ln.gridRowsSizing?.trim();
     if (rows) frameValues.gridTemplateRows = rows;
 
-    frameValues.gap = gapShorthand(ln.gridRowGap, ln.gridColumnGap);
+    const gap = gapShorthand(ln.gridRowGap, ln.gridColumnGap);
+    if (gap) frameValues.gap = gap;
     return frameValues;
   }
 
   // Flex-specific — mode is narrowed to "row" | "column" after grid early-return
-  frameValues.justifyContent = convertJustifyContent(n.primaryAxisAlignItems ?? "MIN");
-  frameValues.alignItems = convertAlignItems(n.counterAxisAlignItems ?? "MIN", n.children, mode);
-  frameValues.wrap = n.layoutWrap === "WRAP" ? true : undefined;
-  frameValues.gap = buildFlexGap(n, mode);
+  const justifyContent = convertJustifyContent(n.primaryAxisAlignItems ?? "MIN");
+  if (justifyContent) frameValues.justifyContent = justifyContent;
+  const alignItems = convertAlignItems(n.counterAxisAlignItems ?? "MIN", n.children, mode);
+  if (alignItems) frameValues.alignItems = alignItems;
+  if (n.layoutWrap === "WRAP") frameValues.wrap = true;
+  const gap = buildFlexGap(n, mode);
+  if (gap) frameValues.gap = gap;
 
   return frameValues;
 }
@@ -90,9 +129,12 @@ function buildSimplifiedLayoutValues(
   n: FigmaDocumentNode,
   parent: FigmaDocumentNode | undefined,
   mode: SimplifiedLayout["mode"],
-  parentGridPacked?: boolean,
+  inAutoLayoutFlow: boolean,
+  parentGrid?: GridParentInfo,
 ): SimplifiedLayout | undefined {
   if (!isLayout(n)) return undefined;
+  // Every sizing and positioning branch below reads the node's box; take it once.
+  const box = n.absoluteBoundingBox;
 
   // The requested root has no parent in the payload, so Figma reports its sizing
   // FIXED relative to an absent container — an artifact of being top-level, not
@@ -112,14 +154,14 @@ function buildSimplifiedLayoutValues(
   // whatever it's placed in) and surface the designed size as a non-binding
   // reference — absolutely-positioned children and the fill-chain still need a
   // concrete size to anchor against. Real FILL/HUG axes are intent; leave them.
-  if (isRoot && n.absoluteBoundingBox) {
+  if (isRoot && box) {
     if (layoutValues.sizing.horizontal === "fixed") {
       layoutValues.sizing.horizontal = "contextual";
-      layoutValues.designedWidth = `${pixelRound(n.absoluteBoundingBox.width)}px`;
+      layoutValues.designedWidth = `${pixelRound(box.width)}px`;
     }
     if (layoutValues.sizing.vertical === "fixed") {
       layoutValues.sizing.vertical = "contextual";
-      layoutValues.designedHeight = `${pixelRound(n.absoluteBoundingBox.height)}px`;
+      layoutValues.designedHeight = `${pixelRound(box.height)}px`;
     }
   }
 
@@ -127,53 +169,50 @@ function buildSimplifiedLayoutValues(
   // places this child. `isLayout(parent)` also screens out top-level nodes
   // (no parent) and parents without bounding boxes (e.g. CANVAS), where
   // coordinates would be meaningless.
-  if (isLayout(parent) && !isInAutoLayoutFlow(n, parent)) {
+  if (isLayout(parent) && !inAutoLayoutFlow) {
     if (n.layoutPositioning === "ABSOLUTE") {
       layoutValues.position = "absolute";
     }
-    if (n.absoluteBoundingBox && parent.absoluteBoundingBox) {
+    const parentBox = parent.absoluteBoundingBox;
+    if (box && parentBox) {
       layoutValues.locationRelativeToParent = {
-        x: pixelRound(n.absoluteBoundingBox.x - parent.absoluteBoundingBox.x),
-        y: pixelRound(n.absoluteBoundingBox.y - parent.absoluteBoundingBox.y),
+        x: pixelRound(box.x - parentBox.x),
+        y: pixelRound(box.y - parentBox.y),
       };
     }
   }
 
   // Grid child properties: positioning, spans, alignment, and z-order
-  const parentIsGrid = parentGridPacked !== undefined;
-  if (parentIsGrid && parent && n.layoutPositioning !== "ABSOLUTE") {
-    Object.assign(layoutValues, buildGridChildPositioning(n, parent, parentGridPacked));
+  const parentIsGrid = parentGrid !== undefined;
+  if (parentIsGrid && n.layoutPositioning !== "ABSOLUTE") {
+    Object.assign(layoutValues, buildGridChildPositioning(n, parentGrid));
   }
 
   // Emit a dimension only when the child isn't stretching that axis and the
   // sizing flag permits it. Stretch detection and the "is FIXED?" rule both
   // depend on whether the parent is flex, grid, or non-auto-layout — see the
   // helpers in ./layout/common.ts for the per-axis vocabulary mapping.
-  if (!isRoot && isRectangle("absoluteBoundingBox", n)) {
+  if (!isRoot && box) {
     const dimensions: { width?: number; height?: number; aspectRatio?: number } = {};
-    const axis = resolveChildAxis(n, parent, mode, parentIsGrid);
+    const axis = resolveChildAxis(parent, inAutoLayoutFlow, mode, parentIsGrid);
     const stretch = getChildStretch(n, axis);
 
     if (!stretch.horizontal && shouldEmitFixedDimension(n.layoutSizingHorizontal, axis)) {
-      dimensions.width = n.absoluteBoundingBox.width;
+      dimensions.width = pixelRound(box.width);
     }
     if (!stretch.vertical && shouldEmitFixedDimension(n.layoutSizingVertical, axis)) {
-      dimensions.height = n.absoluteBoundingBox.height;
+      dimensions.height = pixelRound(box.height);
     }
 
     // Preserves historical behavior: aspectRatio is emitted only for
     // column-parent children. Likely should apply more broadly — pre-existing.
-    if (axis === "column" && n.preserveRatio && n.absoluteBoundingBox.height !== 0) {
-      dimensions.aspectRatio = n.absoluteBoundingBox.width / n.absoluteBoundingBox.height;
+    if (axis === "column" && n.preserveRatio && box.height !== 0) {
+      // Four decimals is well past what a layout can use; the raw quotient emits
+      // up to 17 digits of float noise into the output.
+      dimensions.aspectRatio = Math.round((box.width / box.height) * 10000) / 10000;
     }
 
     if (Object.keys(dimensions).length > 0) {
-      if (dimensions.width) {
-        dimensions.width = pixelRound(dimensions.width);
-      }
-      if (dimensions.height) {
-        dimensions.height = pixelRound(dimensions.height);
-      }
       layoutValues.dimensions = dimensions;
     }
   }
@@ -4,7 +4,7 @@ import type {
   HasLayoutTrait,
 } from "@figma/rest-api-spec";
 import { exhaustiveCheck } from "~/utils/common.js";
-import { isFrame, isInAutoLayoutFlow } from "~/utils/identity.js";
+import { isFrame } from "~/utils/identity.js";
 
 export interface SimplifiedLayout {
   mode: "none" | "row" | "column" | "grid";
@@ -52,57 +52,57 @@ export interface SimplifiedLayout {
   position?: "absolute";
 }
 
+type FigmaSizing = NonNullable<HasLayoutTrait["layoutSizingHorizontal"]>;
+
+const SIZING: Record<FigmaSizing, "fixed" | "fill" | "hug"> = {
+  FIXED: "fixed",
+  FILL: "fill",
+  HUG: "hug",
+};
+
+// MIN, AKA flex-start, is the default alignment and INHERIT defers to the
+// parent — both are deliberately absent so they resolve to undefined.
+const SELF_ALIGN: Partial<
+  Record<NonNullable<HasLayoutTrait["layoutAlign"]>, "flex-end" | "center" | "stretch">
+> = {
+  MAX: "flex-end",
+  CENTER: "center",
+  STRETCH: "stretch",
+};
+
 export function convertSizing(
   s?: HasLayoutTrait["layoutSizingHorizontal"] | HasLayoutTrait["layoutSizingVertical"],
 ) {
-  if (s === "FIXED") return "fixed";
-  if (s === "FILL") return "fill";
-  if (s === "HUG") return "hug";
-  return undefined;
+  return s ? SIZING[s] : undefined;
 }
 
 export function convertSelfAlign(align?: HasLayoutTrait["layoutAlign"]) {
-  switch (align) {
-    case "MIN":
-      // MIN, AKA flex-start, is the default alignment
-      return undefined;
-    case "MAX":
-      return "flex-end";
-    case "CENTER":
-      return "center";
-    case "STRETCH":
-      return "stretch";
-    default:
-      return undefined;
-  }
+  return align ? SELF_ALIGN[align] : undefined;
 }
 
-// Centralized mapping of Figma's layoutMode to our schema's mode tag.
-// Exhaustive switch — if @figma/rest-api-spec ever adds a new layoutMode value,
-// exhaustiveCheck fails the build until we decide how to map it.
+// Centralized mapping of Figma's layoutMode to our schema's mode tag. A full
+// Record rather than Partial: if @figma/rest-api-spec ever adds a new layoutMode
+// value, the missing key fails the build until we decide how to map it.
+const LAYOUT_MODE: Record<
+  NonNullable<HasFramePropertiesTrait["layoutMode"]>,
+  SimplifiedLayout["mode"]
+> = {
+  HORIZONTAL: "row",
+  VERTICAL: "column",
+  GRID: "grid",
+  NONE: "none",
+};
+
 export function layoutModeToSchema(
   layoutMode: HasFramePropertiesTrait["layoutMode"],
 ): SimplifiedLayout["mode"] {
-  switch (layoutMode) {
-    case "HORIZONTAL":
-      return "row";
-    case "VERTICAL":
-      return "column";
-    case "GRID":
-      return "grid";
-    case "NONE":
-    case undefined:
-      return "none";
-    default:
-      return exhaustiveCheck(layoutMode);
-  }
+  return layoutMode ? LAYOUT_MODE[layoutMode] : "none";
 }
 
 export function getParentAutoLayoutMode(parent?: FigmaDocumentNode): "row" | "column" | undefined {
   if (!isFrame(parent)) return undefined;
-  if (parent.layoutMode === "HORIZONTAL") return "row";
-  if (parent.layoutMode === "VERTICAL") return "column";
-  return undefined;
+  const mode = layoutModeToSchema(parent.layoutMode);
+  return mode === "row" || mode === "column" ? mode : undefined;
 }
 
 /**
@@ -118,7 +118,7 @@ export type ChildAxis = "row" | "column" | "grid" | "none";
 export type StretchFlags = { horizontal: boolean; vertical: boolean };
 
 /**
- * Determines the axis context for interpreting `n`'s sizing/stretch flags.
+ * Determines the axis context for interpreting a child's sizing/stretch flags.
  *
  * For flex children, `layoutGrow` is "stretch along main axis" and
  * `layoutAlign === "STRETCH"` is "stretch along cross axis" — both keyed to the
@@ -127,8 +127,8 @@ export type StretchFlags = { horizontal: boolean; vertical: boolean };
  * silently mis-emits dimensions (see fix #379).
  */
 export function resolveChildAxis(
-  n: FigmaDocumentNode,
   parent: FigmaDocumentNode | undefined,
+  inAutoLayoutFlow: boolean,
   ownMode: SimplifiedLayout["mode"],
   parentIsGrid: boolean,
 ): ChildAxis {
@@ -139,11 +139,14 @@ export function resolveChildAxis(
   // Figma spec, layoutGrow/layoutAlign only apply to direct auto-layout
   // children, so consulting them outside that context is arguably wrong —
   // but this preserves the pre-refactor behavior.
-  const parentAxis = isInAutoLayoutFlow(n, parent) ? getParentAutoLayoutMode(parent) : undefined;
+  const parentAxis = inAutoLayoutFlow ? getParentAutoLayoutMode(parent) : undefined;
   if (parentAxis) return parentAxis;
   return ownMode === "row" || ownMode === "column" ? ownMode : "none";
 }
 
+// Hand-positioned children, the bulk of most trees, all share this answer.
+const NO_STRETCH: Readonly<StretchFlags> = { horizontal: false, vertical: false };
+
 /**
  * Per-axis "is this child stretching to fill the parent?" flags, normalizing
  * Figma's flex vs grid vocabularies into the same shape.
@@ -153,7 +156,7 @@ export function resolveChildAxis(
  * - Grid children use `layoutSizing{Horizontal,Vertical} === "FILL"` (no
  *   main/cross — properties are axis-named directly).
  */
-export function getChildStretch(n: HasLayoutTrait, axis: ChildAxis): StretchFlags {
+export function getChildStretch(n: HasLayoutTrait, axis: ChildAxis): Readonly<StretchFlags> {
   switch (axis) {
     case "grid":
       return {
@@ -165,7 +168,7 @@ export function getChildStretch(n: HasLayoutTrait, axis: ChildAxis): StretchFlag
     case "column":
       return { horizontal: n.layoutAlign === "STRETCH", vertical: !!n.layoutGrow };
     case "none":
-      return { horizontal: false, vertical: false };
+      return NO_STRETCH;
     default:
       return exhaustiveCheck(axis);
   }
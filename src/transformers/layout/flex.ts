@@ -1,19 +1,32 @@
 import type { Node as FigmaDocumentNode, HasFramePropertiesTrait } from "@figma/rest-api-spec";
 import { gapShorthand } from "./common.js";
 
+// MIN (flex-start) is the CSS default for both axes, so it's omitted and
+// resolves to undefined.
+const JUSTIFY_CONTENT: Partial<
+  Record<
+    NonNullable<HasFramePropertiesTrait["primaryAxisAlignItems"]>,
+    "flex-end" | "center" | "space-between"
+  >
+> = {
+  MAX: "flex-end",
+  CENTER: "center",
+  SPACE_BETWEEN: "space-between",
+};
+
+const ALIGN_ITEMS: Partial<
+  Record<
+    NonNullable<HasFramePropertiesTrait["counterAxisAlignItems"]>,
+    "flex-end" | "center" | "baseline"
+  >
+> = {
+  MAX: "flex-end",
+  CENTER: "center",
+  BASELINE: "baseline",
+};
+
 export function convertJustifyContent(align?: HasFramePropertiesTrait["primaryAxisAlignItems"]) {
-  switch (align) {
-    case "MIN":
-      return undefined;
-    case "MAX":
-      return "flex-end";
-    case "CENTER":
-      return "center";
-    case "SPACE_BETWEEN":
-      return "space-between";
-    default:
-      return undefined;
-  }
+  return align ? JUSTIFY_CONTENT[align] : undefined;
 }
 
 export function convertAlignItems(
@@ -23,27 +36,17 @@ export function convertAlignItems(
 ) {
   // Row cross-axis is vertical; column cross-axis is horizontal
   const crossSizing = mode === "row" ? "layoutSizingVertical" : "layoutSizingHorizontal";
+  // A plain read is enough: an absent property is undefined and fails both
+  // comparisons, so an `in` probe before each read would only double the lookups.
   const allStretch =
     children.length > 0 &&
-    children.every(
-      (c) =>
-        ("layoutPositioning" in c && c.layoutPositioning === "ABSOLUTE") ||
-        (crossSizing in c && (c as Record<string, unknown>)[crossSizing] === "FILL"),
-    );
+    children.every((c) => {
+      const child = c as Record<string, unknown>;
+      return child.layoutPositioning === "ABSOLUTE" || child[crossSizing] === "FILL";
+    });
   if (allStretch) return "stretch";
 
-  switch (align) {
-    case "MIN":
-      return undefined;
-    case "MAX":
-      return "flex-end";
-    case "CENTER":
-      return "center";
-    case "BASELINE":
-      return "baseline";
-    default:
-      return undefined;
-  }
+  return align ? ALIGN_ITEMS[align] : undefined;
 }
 
 // SPACE_BETWEEN computes gaps dynamically — the API returns stale spacing
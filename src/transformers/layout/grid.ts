@@ -1,5 +1,5 @@
 import type { Node as FigmaDocumentNode, HasLayoutTrait } from "@figma/rest-api-spec";
-import { hasGridLayout, hasValue, isLayout } from "~/utils/identity.js";
+import { hasGridLayout, isLayout } from "~/utils/identity.js";
 import type { SimplifiedLayout } from "./common.js";
 
 /**
@@ -22,7 +22,7 @@ import type { SimplifiedLayout } from "./common.js";
  * existing order already matches anchor order (no work to do).
  */
 export function computeGridChildOrder(parent: FigmaDocumentNode): number[] | null {
-  if (!hasGridLayout(parent) || !hasValue("children", parent)) return null;
+  if (!hasGridLayout(parent) || !("children" in parent)) return null;
   const children = parent.children as FigmaDocumentNode[];
   if (children.length < 2) return null;
 
@@ -103,9 +103,8 @@ export function isPackedGrid(children: FigmaDocumentNode[]): boolean {
  * Edges that merely touch (e.g., adjacent cells with gap = 0) are NOT
  * overlap; strict inequalities below handle that.
  */
-function gridChildrenOverlap(parent: FigmaDocumentNode): boolean {
-  if (!hasValue("children", parent)) return false;
-  const boxes = (parent.children as FigmaDocumentNode[])
+function gridChildrenOverlap(children: FigmaDocumentNode[]): boolean {
+  const boxes = children
     .filter((c) => isLayout(c) && c.layoutPositioning !== "ABSOLUTE")
     .map((c) => (c as HasLayoutTrait).absoluteBoundingBox)
     .filter((b): b is NonNullable<typeof b> => b != null);
@@ -127,15 +126,45 @@ function gridChildrenOverlap(parent: FigmaDocumentNode): boolean {
   return false;
 }
 
-function convertGridAlign(align: "MIN" | "CENTER" | "MAX"): "start" | "end" | "center" {
-  switch (align) {
-    case "MIN":
-      return "start";
-    case "MAX":
-      return "end";
-    case "CENTER":
-      return "center";
+const GRID_ALIGN: Record<"MIN" | "CENTER" | "MAX", "start" | "end" | "center"> = {
+  MIN: "start",
+  MAX: "end",
+  CENTER: "center",
+};
+
+/**
+ * What a grid child needs to know about its parent, derived from the parent's
+ * whole child list.
+ */
+export interface GridParentInfo {
+  packed: boolean;
+  // Children whose slot changes under anchor-order sorting, mapped to their
+  // original Figma z-order index. Empty when the sort is a no-op or no in-flow
+  // siblings overlap, since zIndex is noise in both cases.
+  movedChildren: Map<FigmaDocumentNode, number>;
+}
+
+// Every child of a grid asks the same questions of its parent, and each answer
+// scans all siblings (the overlap check pairwise), so deriving them per child
+// made a grid cubic in its child count. Keyed on the parent node so entries go
+// away with the response they came from.
+const gridParentInfoCache = new WeakMap<FigmaDocumentNode, GridParentInfo>();
+
+export function getGridParentInfo(parent: FigmaDocumentNode): GridParentInfo {
+  let info = gridParentInfoCache.get(parent);
+  if (!info) {
+    const children = "children" in parent ? (parent.children as FigmaDocumentNode[]) : [];
+    const movedChildren = new Map<FigmaDocumentNode, number>();
+    const order = computeGridChildOrder(parent);
+    if (order && gridChildrenOverlap(children)) {
+      order.forEach((originalIndex, newIndex) => {
+        if (originalIndex !== newIndex) movedChildren.set(children[originalIndex], originalIndex);
+      });
+    }
+    info = { packed: isPackedGrid(children), movedChildren };
+    gridParentInfoCache.set(parent, info);
   }
+  return info;
 }
 
 /**
@@ -144,19 +173,18 @@ function convertGridAlign(align: "MIN" | "CENTER" | "MAX"): "start" | "end" | "c
  * the `zIndex` annotation that preserves Figma z-order when overlap matters.
  *
  * The caller is responsible for confirming the parent is a grid and the child
- * is in-flow (not ABSOLUTE).
+ * is in-flow (not ABSOLUTE), and passes that parent's {@link getGridParentInfo}.
  */
 export function buildGridChildPositioning(
   n: HasLayoutTrait,
-  parent: FigmaDocumentNode,
-  packed: boolean,
+  grid: GridParentInfo,
 ): Partial<SimplifiedLayout> {
   const out: Partial<SimplifiedLayout> = {};
 
   const colSpan = n.gridColumnSpan ?? 1;
   const rowSpan = n.gridRowSpan ?? 1;
 
-  if (!packed) {
+  if (!grid.packed) {
     const col = (n.gridColumnAnchorIndex ?? 0) + 1; // CSS grid is 1-based
     const row = (n.gridRowAnchorIndex ?? 0) + 1;
     out.gridColumn = colSpan > 1 ? `${col} / span ${colSpan}` : `${col}`;
@@ -168,28 +196,20 @@ export function buildGridChildPositioning(
 
   const hAlign = n.gridChildHorizontalAlign;
   if (hAlign && hAlign !== "AUTO") {
-    out.justifySelf = convertGridAlign(hAlign);
+    out.justifySelf = GRID_ALIGN[hAlign];
   }
 
   const vAlign = n.gridChildVerticalAlign;
   if (vAlign && vAlign !== "AUTO") {
-    out.alignSelf = convertGridAlign(vAlign);
+    out.alignSelf = GRID_ALIGN[vAlign];
   }
 
   // When sorting moves this child AND siblings actually overlap, surface its
-  // original Figma stacking position so CSS can preserve z-order. Skipped when:
-  //   - sort is a no-op (no reorder happened)
-  //   - this child's slot didn't move
-  //   - no in-flow siblings overlap (stacking can't affect rendering)
-  const order = computeGridChildOrder(parent);
-  if (order && gridChildrenOverlap(parent)) {
-    const originalIndex = (parent as { children: FigmaDocumentNode[] }).children.indexOf(
-      n as FigmaDocumentNode,
-    );
-    const newIndex = order.indexOf(originalIndex);
-    if (originalIndex !== newIndex) {
-      out.zIndex = originalIndex;
-    }
+  // original Figma stacking position so CSS can preserve z-order. See
+  // GridParentInfo.movedChildren for when this is skipped.
+  const originalIndex = grid.movedChildren.get(n as FigmaDocumentNode);
+  if (originalIndex !== undefined) {
+    out.zIndex = originalIndex;
   }
 
   return out;
@@ -1,9 +1,9 @@
 import type { Node as FigmaDocumentNode, Paint } from "@figma/rest-api-spec";
 import { generateCSSShorthand, isVisible } from "~/utils/common.js";
 import { tagError } from "~/utils/error-meta.js";
-import { hasValue, isStrokeWeights } from "~/utils/identity.js";
+import { isStrokeWeights } from "~/utils/identity.js";
 
-import { convertColor, formatRGBAColor } from "./style/color.js";
+import { formatSolidColor } from "./style/color.js";
 import { translateScaleMode, handleImageTransform, parsePatternPaint } from "./style/image.js";
 import type { SimplifiedImageFill } from "./style/image.js";
 import { convertGradientToCss } from "./style/gradient.js";
@@ -12,8 +12,8 @@ import { convertGradientToCss } from "./style/gradient.js";
 // gradient) because gradient geometry alone is ~290 lines. This module stays the
 // single public entry point — `~/transformers/style.js` — so the re-exports below
 // preserve the import surface every caller already uses.
-export type { CSSRGBAColor, CSSHexColor, ColorValue } from "./style/color.js";
-export { convertColor, formatRGBAColor, flattenSolidFills } from "./style/color.js";
+export type { CSSRGBAColor, CSSHexColor } from "./style/color.js";
+export { formatRGBA, flattenSolidFills } from "./style/color.js";
 export type { SimplifiedImageFill, SimplifiedPatternFill } from "./style/image.js";
 export type { SimplifiedGradientFill } from "./style/gradient.js";
 
@@ -41,37 +41,44 @@ export type SimplifiedStroke = {
  *
  * @param n - The Figma node to extract stroke information from
  * @param hasChildren - Whether the node has children (affects paint processing)
- * @returns Simplified stroke object with colors and properties
+ * @returns Simplified stroke object with colors and properties; only `colors` (empty)
+ * when the node has no visible stroke paint
  */
 export function buildSimplifiedStrokes(
   n: FigmaDocumentNode,
   hasChildren: boolean = false,
 ): SimplifiedStroke {
-  let strokes: SimplifiedStroke = { colors: [] };
-  if (hasValue("strokes", n) && Array.isArray(n.strokes) && n.strokes.length) {
-    // Reverse to match CSS stacking order (Figma layers bottom-to-top, CSS top-to-bottom)
-    strokes.colors = n.strokes
-      .filter(isVisible)
-      .map((stroke) => parsePaint(stroke, hasChildren))
-      .reverse();
-  }
+  // Each field's own type check already rejects undefined, so a plain `in`
+  // narrows the node union without a generic hasValue guard call per field.
+  const strokes: SimplifiedStroke = { colors: [] };
+  if (!("strokes" in n) || !Array.isArray(n.strokes) || !n.strokes.length) return strokes;
+
+  // Reverse to match CSS stacking order (Figma layers bottom-to-top, CSS top-to-bottom)
+  strokes.colors = n.strokes
+    .filter(isVisible)
+    .map((stroke) => parsePaint(stroke, hasChildren))
+    .reverse();
+  // Weight, dashes, and alignment describe how a paint is drawn. With no visible
+  // paint there's nothing to draw, so most nodes stop here.
+  if (!strokes.colors.length) return strokes;
 
-  if (hasValue("strokeWeight", n) && typeof n.strokeWeight === "number" && n.strokeWeight > 0) {
+  // Per-side weights take precedence over the uniform one. All-zero sides yield
+  // no shorthand, and then no stroke width at all.
+  if ("individualStrokeWeights" in n && isStrokeWeights(n.individualStrokeWeights)) {
+    const strokeWeight = generateCSSShorthand(n.individualStrokeWeights);
+    if (strokeWeight) strokes.strokeWeight = strokeWeight;
+  } else if ("strokeWeight" in n && typeof n.strokeWeight === "number" && n.strokeWeight > 0) {
     strokes.strokeWeight = `${n.strokeWeight}px`;
   }
 
-  if (hasValue("strokeDashes", n) && Array.isArray(n.strokeDashes) && n.strokeDashes.length) {
+  if ("strokeDashes" in n && Array.isArray(n.strokeDashes) && n.strokeDashes.length) {
     strokes.strokeDashes = n.strokeDashes;
   }
 
-  if (hasValue("strokeAlign", n) && (n.strokeAlign === "OUTSIDE" || n.strokeAlign === "CENTER")) {
+  if ("strokeAlign" in n && (n.strokeAlign === "OUTSIDE" || n.strokeAlign === "CENTER")) {
     strokes.strokeAlign = n.strokeAlign;
   }
 
-  if (hasValue("individualStrokeWeights", n, isStrokeWeights)) {
-    strokes.strokeWeight = generateCSSShorthand(n.individualStrokeWeights);
-  }
-
   return strokes;
 }
 
@@ -126,12 +133,7 @@ export function parsePaint(raw: Paint, hasChildren: boolean = false): Simplified
     };
   } else if (raw.type === "SOLID") {
     // treat as SOLID
-    const { hex, opacity } = convertColor(raw.color!, raw.opacity);
-    if (opacity === 1) {
-      return hex;
-    } else {
-      return formatRGBAColor(raw.color!, opacity);
-    }
+    return formatSolidColor(raw.color!, raw.opacity);
   } else if (raw.type === "PATTERN") {
     return parsePatternPaint(raw);
   } else if (
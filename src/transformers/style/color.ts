@@ -2,47 +2,38 @@ import type { Paint, RGBA } from "@figma/rest-api-spec";
 
 export type CSSRGBAColor = `rgba(${number}, ${number}, ${number}, ${number})`;
 export type CSSHexColor = `#${string}`;
-export interface ColorValue {
-  hex: CSSHexColor;
-  opacity: number;
-}
+
+// Two-digit uppercase hex for every byte value, so hex colors are assembled from
+// three lookups instead of a number-to-string radix conversion per color.
+const HEX_BYTE = Array.from({ length: 256 }, (_, i) =>
+  i.toString(16).padStart(2, "0").toUpperCase(),
+);
 
 /**
- * Convert color from RGBA to { hex, opacity }
+ * Resolve a color to the CSS form the output uses: hex when the effective alpha
+ * rounds to 1, otherwise rgba().
  *
  * @param color - The color to convert, including alpha channel
  * @param opacity - The opacity of the color, if not included in alpha channel
  * @returns The converted color
  **/
-export function convertColor(color: RGBA, opacity = 1): ColorValue {
-  const r = Math.round(color.r * 255);
-  const g = Math.round(color.g * 255);
-  const b = Math.round(color.b * 255);
-
-  // Alpha channel defaults to 1. If opacity and alpha are both and < 1, their effects are multiplicative
+export function formatSolidColor(color: RGBA, opacity = 1): CSSHexColor | CSSRGBAColor {
+  // Alpha channel defaults to 1. If opacity and alpha are both < 1, their effects are multiplicative
   const a = Math.round(opacity * color.a * 100) / 100;
+  if (a !== 1) return formatRGBA(color.r, color.g, color.b, a);
 
-  const hex = ("#" +
-    ((1 << 24) + (r << 16) + (g << 8) + b).toString(16).slice(1).toUpperCase()) as CSSHexColor;
-
-  return { hex, opacity: a };
-}
-
-/**
- * Convert color from Figma RGBA to rgba(#, #, #, #) CSS format
- *
- * @param color - The color to convert, including alpha channel
- * @param opacity - The opacity of the color, if not included in alpha channel
- * @returns The converted color
- **/
-export function formatRGBAColor(color: RGBA, opacity = 1): CSSRGBAColor {
   const r = Math.round(color.r * 255);
   const g = Math.round(color.g * 255);
   const b = Math.round(color.b * 255);
-  // Alpha channel defaults to 1. If opacity and alpha are both and < 1, their effects are multiplicative
-  const a = Math.round(opacity * color.a * 100) / 100;
+  return `#${HEX_BYTE[r]}${HEX_BYTE[g]}${HEX_BYTE[b]}`;
+}
 
-  return `rgba(${r}, ${g}, ${b}, ${a})`;
+/**
+ * Format channels as rgba(#, #, #, #). Channels are 0..1 and `a` is the final
+ * alpha (any paint/effect opacity already folded in).
+ */
+export function formatRGBA(r: number, g: number, b: number, a: number): CSSRGBAColor {
+  return `rgba(${Math.round(r * 255)}, ${Math.round(g * 255)}, ${Math.round(b * 255)}, ${Math.round(a * 100) / 100})`;
 }
 
 /**
@@ -105,7 +96,5 @@ export function flattenSolidFills(paints: Paint[]): CSSHexColor | CSSRGBAColor |
     acc = compositeOver(toStraight(paints[i]), acc);
   }
 
-  const composited: RGBA = acc;
-  const { hex, opacity } = convertColor(composited);
-  return opacity === 1 ? hex : formatRGBAColor(composited);
+  return formatSolidColor(acc);
 }
@@ -1,5 +1,5 @@
 import type { Paint, RGBA, Vector } from "@figma/rest-api-spec";
-import { formatRGBAColor } from "./color.js";
+import { formatRGBA } from "./color.js";
 
 export type SimplifiedGradientFill = {
   type: "GRADIENT_LINEAR" | "GRADIENT_RADIAL" | "GRADIENT_ANGULAR" | "GRADIENT_DIAMOND";
@@ -25,16 +25,18 @@ type GradientMapper = (
 
 /**
  * Format stops as CSS `<color> <pos>%` segments at their original positions.
- * `paintOpacity` multiplies each stop's `color.a` (via `formatRGBAColor`).
+ * `paintOpacity` multiplies each stop's `color.a`.
  * Mappers that remap positions (e.g. linear's extended-line case) format inline.
  */
 function formatStops(stops: GradientStop[], paintOpacity: number): string {
-  return stops
-    .map(
-      ({ position, color }) =>
-        `${formatRGBAColor(color, paintOpacity)} ${Math.round(position * 100)}%`,
-    )
-    .join(", ");
+  // One pass straight into the result string; no per-stop segment array to join.
+  let out = "";
+  for (const { position, color } of stops) {
+    if (out) out += ", ";
+    const cssColor = formatRGBA(color.r, color.g, color.b, paintOpacity * color.a);
+    out += `${cssColor} ${Math.round(position * 100)}%`;
+  }
+  return out;
 }
 
 /**
@@ -72,7 +74,7 @@ function mapLinearGradient(
     const fullLineEnd = Math.max(extendedIntersections[0], extendedIntersections[1]);
     // Map gradient stops from the Figma line segment to the full CSS line
     const mappedStops = gradientStops.map(({ position, color }) => {
-      const cssColor = formatRGBAColor(color, paintOpacity);
+      const cssColor = formatRGBA(color.r, color.g, color.b, paintOpacity * color.a);
 
       // Position along the Figma gradient line (0 = start handle, 1 = end handle)
       const figmaLinePosition = position;
@@ -1,5 +1,8 @@
 import fs from "fs";
 import path from "path";
+import { Readable } from "stream";
+import { pipeline } from "stream/promises";
+import type { ReadableStream as NodeReadableStream } from "stream/web";
 import { tagError } from "~/utils/error-meta.js";
 import { isWithin } from "~/utils/local-path.js";
 
@@ -17,10 +20,10 @@ export async function downloadFigmaImage(
   imageUrl: string,
 ): Promise<string> {
   try {
-    // Ensure local path exists
-    if (!fs.existsSync(localPath)) {
-      fs.mkdirSync(localPath, { recursive: true });
-    }
+    // Every image in a batch races through here concurrently; the sync calls
+    // stalled the event loop (and the other downloads' sockets) on each one.
+    // Recursive mkdir is a no-op when the directory already exists.
+    await fs.promises.mkdir(localPath, { recursive: true });
 
     const fullPath = path.resolve(path.join(localPath, fileName));
     if (!isWithin(localPath, fullPath)) {
@@ -29,58 +32,38 @@ export async function downloadFigmaImage(
       });
     }
 
-    // Use fetch to download the image
+    // Global fetch shares one keep-alive pool (and the proxy dispatcher from
+    // server.ts) across calls, so consecutive downloads reuse connections.
     const response = await fetch(imageUrl, {
       method: "GET",
     });
 
     if (!response.ok) {
+      // An unread body pins its socket until GC; release it back to the pool.
+      await response.body?.cancel();
       tagError(new Error(`Failed to download image: ${response.statusText}`), {
         category: "image_download",
       });
     }
 
-    // Create write stream
-    const writer = fs.createWriteStream(fullPath);
-
-    // Get the response as a readable stream and pipe it to the file
-    const reader = response.body?.getReader();
-    if (!reader) {
+    if (!response.body) {
       tagError(new Error("Failed to get response body"), { category: "image_download" });
     }
 
-    return new Promise((resolve, reject) => {
-      // Process stream
-      const processStream = async () => {
-        try {
-          while (true) {
-            const { done, value } = await reader.read();
-            if (done) {
-              writer.end();
-              break;
-            }
-            writer.write(value);
-          }
-        } catch (err) {
-          writer.end();
-          fs.unlink(fullPath, () => {});
-          reject(err);
-        }
-      };
-
-      // Resolve only when the stream is fully written
-      writer.on("finish", () => {
-        resolve(fullPath);
-      });
-
-      writer.on("error", (err) => {
-        reader.cancel();
-        fs.unlink(fullPath, () => {});
-        reject(new Error(`Failed to write image: ${err.message}`));
-      });
-
-      processStream();
-    });
+    // pipeline honors backpressure: a disk slower than the network pauses the
+    // socket instead of queueing the rest of the image in the write buffer. It
+    // also tears down both ends on failure, so only the partial file needs
+    // cleaning up.
+    try {
+      await pipeline(
+        Readable.fromWeb(response.body as NodeReadableStream<Uint8Array>),
+        fs.createWriteStream(fullPath),
+      );
+    } catch (err) {
+      fs.unlink(fullPath, () => {});
+      throw err;
+    }
+    return fullPath;
   } catch (error) {
     const errorMessage = error instanceof Error ? error.message : String(error);
     throw new Error(`Error downloading image: ${errorMessage}`, { cause: error });
@@ -88,46 +71,28 @@ export async function downloadFigmaImage(
 }
 
 /**
- * Remove keys with empty arrays or empty objects from an object.
- * @param input - The input object or value.
- * @returns The processed object or the original value.
+ * Create a gate that runs at most `concurrency` async tasks at once. Extra tasks
+ * wait in call order and each takes over a finished task's slot directly, so a
+ * late caller can never slip in ahead of the queue.
  */
-export function removeEmptyKeys<T>(input: T): T {
-  // If not an object type or null, return directly
-  if (typeof input !== "object" || input === null) {
-    return input;
-  }
-
-  // Handle array type
-  if (Array.isArray(input)) {
-    return input.map((item) => removeEmptyKeys(item)) as T;
-  }
-
-  // Handle object type
-  const result = {} as T;
-  for (const key in input) {
-    if (Object.prototype.hasOwnProperty.call(input, key)) {
-      const value = input[key];
-
-      // Recursively process nested objects
-      const cleanedValue = removeEmptyKeys(value);
-
-      // Skip empty arrays and empty objects
-      if (
-        cleanedValue !== undefined &&
-        !(Array.isArray(cleanedValue) && cleanedValue.length === 0) &&
-        !(
-          typeof cleanedValue === "object" &&
-          cleanedValue !== null &&
-          Object.keys(cleanedValue).length === 0
-        )
-      ) {
-        result[key] = cleanedValue;
-      }
+export function createLimiter(concurrency: number) {
+  let active = 0;
+  const queue: (() => void)[] = [];
+
+  return async function limit<T>(task: () => Promise<T>): Promise<T> {
+    if (active < concurrency) {
+      active++;
+    } else {
+      await new Promise<void>((resolve) => queue.push(resolve));
     }
-  }
-
-  return result;
+    try {
+      return await task();
+    } finally {
+      const next = queue.shift();
+      if (next) next();
+      else active--;
+    }
+  };
 }
 
 /**
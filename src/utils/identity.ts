@@ -1,10 +1,5 @@
-import type {
-  Rectangle,
-  HasLayoutTrait,
-  StrokeWeights,
-  HasFramePropertiesTrait,
-} from "@figma/rest-api-spec";
-import { isTruthy } from "remeda";
+import type { HasLayoutTrait, StrokeWeights, HasFramePropertiesTrait } from "@figma/rest-api-spec";
+import { isNumber, isTruthy } from "remeda";
 import type { CSSHexColor, CSSRGBAColor } from "~/transformers/style.js";
 
 export { isTruthy };
@@ -36,16 +31,16 @@ export function isFrame(val: unknown): val is HasFramePropertiesTrait {
 }
 
 export function isLayout(val: unknown): val is HasLayoutTrait {
+  if (typeof val !== "object" || !val || !("absoluteBoundingBox" in val)) return false;
+  // Read the box once rather than once per key probe.
+  const box = val.absoluteBoundingBox;
   return (
-    typeof val === "object" &&
-    !!val &&
-    "absoluteBoundingBox" in val &&
-    typeof val.absoluteBoundingBox === "object" &&
-    !!val.absoluteBoundingBox &&
-    "x" in val.absoluteBoundingBox &&
-    "y" in val.absoluteBoundingBox &&
-    "width" in val.absoluteBoundingBox &&
-    "height" in val.absoluteBoundingBox
+    typeof box === "object" &&
+    !!box &&
+    "x" in box &&
+    "y" in box &&
+    "width" in box &&
+    "height" in box
   );
 }
 
@@ -110,28 +105,12 @@ export function isStrokeWeights(val: unknown): val is StrokeWeights {
   );
 }
 
-export function isRectangle<T, K extends string>(
-  key: K,
-  obj: T,
-): obj is T & { [P in K]: Rectangle } {
-  const recordObj = obj as Record<K, unknown>;
-  return (
-    typeof obj === "object" &&
-    !!obj &&
-    key in recordObj &&
-    typeof recordObj[key] === "object" &&
-    !!recordObj[key] &&
-    "x" in recordObj[key] &&
-    "y" in recordObj[key] &&
-    "width" in recordObj[key] &&
-    "height" in recordObj[key]
-  );
-}
-
 export function isRectangleCornerRadii(val: unknown): val is number[] {
-  return Array.isArray(val) && val.length === 4 && val.every((v) => typeof v === "number");
+  // A shared predicate rather than an inline arrow, which would be a new closure
+  // per call.
+  return Array.isArray(val) && val.length === 4 && val.every(isNumber);
 }
 
 export function isCSSColorValue(val: unknown): val is CSSRGBAColor | CSSHexColor {
-  return typeof val === "string" && (val.startsWith("#") || val.startsWith("rgba"));
+  return typeof val === "string" && (val[0] === "#" || val.startsWith("rgba"));
 }